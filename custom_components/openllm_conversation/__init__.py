@@ -7,15 +7,20 @@ OpenAI-compatible API endpoint, such as LiteLLM, Ollama, LocalAI, etc.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
 
-from .api import OpenLLMApiClient
+from .api import OpenLLMApiClient, OpenLLMApiError, create_session
 from .const import (
     CONF_API_KEY,
     CONF_BASE_URL,
     CONF_TIMEOUT,
+    DATA_SESSION,
+    DATA_SESSION_CLOSE_LISTENER,
     DEFAULT_TIMEOUT,
     DOMAIN,
 )
@@ -26,6 +31,63 @@ _LOGGER = logging.getLogger(__name__)
 PLATFORMS: list[str] = ["conversation", "ai_task"]
 
 
+@dataclass(slots=True)
+class OpenLLMData:
+    """Runtime data stored in hass.data for each config entry.
+
+    Attributes:
+        client: The API client shared by the entry's platforms.
+    """
+
+    client: OpenLLMApiClient
+
+
+def _async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Get the aiohttp session shared by all config entries.
+
+    Reusing one session keeps pooled keep-alive connections across clients
+    instead of paying a new TCP/TLS handshake per config entry. Config
+    entries are not unloaded on shutdown, so the session is also closed
+    when Home Assistant stops.
+
+    Args:
+        hass: Home Assistant instance.
+
+    Returns:
+        The shared aiohttp ClientSession.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session: aiohttp.ClientSession | None = domain_data.get(DATA_SESSION)
+    if session is None or session.closed:
+        session = create_session()
+        domain_data[DATA_SESSION] = session
+
+        async def _async_close_session(_event: Event) -> None:
+            """Close the session when Home Assistant stops."""
+            domain_data.pop(DATA_SESSION_CLOSE_LISTENER, None)
+            if not session.closed:
+                await session.close()
+
+        if remove_listener := domain_data.get(DATA_SESSION_CLOSE_LISTENER):
+            remove_listener()
+        domain_data[DATA_SESSION_CLOSE_LISTENER] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close_session
+        )
+    return session
+
+
+async def _async_warm_up(client: OpenLLMApiClient) -> None:
+    """Open a pooled connection to the API ahead of the first request.
+
+    Args:
+        client: The API client to warm up.
+    """
+    try:
+        await client.test_connection()
+    except (OpenLLMApiError, aiohttp.ClientError) as err:
+        _LOGGER.debug("Connection warm-up failed: %s", err)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up OpenLLM Conversation from a config entry.
 
@@ -36,7 +98,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Returns:
         True if setup was successful.
     """
-    hass.data.setdefault(DOMAIN, {})
+    session = _async_get_session(hass)
 
     # Create shared API client
     client = OpenLLMApiClient(
@@ -45,11 +107,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         timeout=entry.options.get(
             CONF_TIMEOUT, entry.data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
         ),
+        session=session,
     )
 
-    hass.data[DOMAIN][entry.entry_id] = {
-        "client": client,
-    }
+    hass.data[DOMAIN][entry.entry_id] = OpenLLMData(client=client)
+
+    # Establish the connection while the platforms are being set up, so the
+    # first conversation turn does not pay for the TCP/TLS handshake
+    entry.async_create_background_task(
+        hass, _async_warm_up(client), f"{DOMAIN} connection warm-up"
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -72,10 +139,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok: bool = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        data = hass.data[DOMAIN].pop(entry.entry_id, None)
-        if data and "client" in data:
-            client: OpenLLMApiClient = data["client"]
-            await client.close()
+        domain_data = hass.data[DOMAIN]
+        data: OpenLLMData | None = domain_data.pop(entry.entry_id, None)
+        if data is not None:
+            await data.client.close()
+
+        # Close the shared session once the last entry is unloaded
+        if domain_data.keys() <= {DATA_SESSION, DATA_SESSION_CLOSE_LISTENER}:
+            if remove_listener := domain_data.pop(DATA_SESSION_CLOSE_LISTENER, None):
+                remove_listener()
+            session: aiohttp.ClientSession | None = domain_data.pop(DATA_SESSION, None)
+            if session is not None and not session.closed:
+                await session.close()
 
     return unload_ok
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any
+import re
+from functools import lru_cache
+from typing import Any, Final
 
+import orjson
 from homeassistant.components import ai_task, conversation
 from homeassistant.components.ai_task import AITaskEntity, AITaskEntityFeature
 from homeassistant.config_entries import ConfigEntry
@@ -13,6 +15,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from . import OpenLLMData
 from .api import OpenLLMApiClient, OpenLLMApiError
 from .const import (
     CONF_MAX_TOKENS,
@@ -32,6 +35,72 @@ AI_TASK_SYSTEM_PROMPT = (
     "When asked to generate structured data, respond with valid JSON only."
 )
 
+# Markdown code fence around a response, with optional language tag and
+# optional closing fence
+_FENCE_RE = re.compile(r"\A```[\w-]*[ \t]*\n(.*?)(?:\n?```)?\Z", re.DOTALL)
+
+# Responses longer than this (in characters) are decoded in the executor
+EXECUTOR_PARSE_THRESHOLD: Final = 128 * 1024
+
+
+@lru_cache(maxsize=64)
+def _build_system_prompt(structure_fields: tuple[str, ...]) -> str:
+    """Build the system prompt for a task.
+
+    Each generate_data call validates a new structure object, but tasks of
+    the same kind request the same fields, so prompts are cached by field
+    names.
+
+    Args:
+        structure_fields: Field names of the requested structure, if any.
+
+    Returns:
+        The system prompt, with JSON instructions if fields were given.
+    """
+    if not structure_fields:
+        return AI_TASK_SYSTEM_PROMPT
+
+    fields_str = ", ".join(f'"{f}"' for f in structure_fields)
+    example_str = ", ".join(f'"{f}": "value"' for f in structure_fields)
+    return (
+        f"{AI_TASK_SYSTEM_PROMPT}"
+        "\n\nIMPORTANT: You must respond with ONLY a valid JSON object. "
+        f"The JSON must have these fields: {fields_str}. "
+        f"Example format: {{{example_str}}}. "
+        "Do not include any text before or after the JSON object."
+    )
+
+
+def _decode_json_response(response_text: str) -> Any:
+    """Decode the JSON object in a model response.
+
+    Markdown code fences are stripped first. If the remaining text is not
+    valid JSON, the outermost {...} block is tried, since models often
+    surround the object with prose despite being told not to.
+
+    Args:
+        response_text: The raw model response.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        orjson.JSONDecodeError: If no valid JSON could be found.
+    """
+    clean_response = response_text.strip()
+    if match := _FENCE_RE.match(clean_response):
+        clean_response = match.group(1)
+    try:
+        return orjson.loads(clean_response)
+    except orjson.JSONDecodeError:
+        # Slice from the first "{" to the last "}"; linear, unlike a regex
+        # search for the same span
+        start = clean_response.find("{")
+        end = clean_response.rfind("}")
+        if start == -1 or end <= start:
+            raise
+        return orjson.loads(clean_response[start : end + 1])
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -45,8 +114,8 @@ async def async_setup_entry(
         config_entry: The config entry for this integration.
         async_add_entities: Callback to add entities to Home Assistant.
     """
-    client: OpenLLMApiClient = hass.data[DOMAIN][config_entry.entry_id]["client"]
-    entity = OpenLLMAITaskEntity(config_entry, client)
+    data: OpenLLMData = hass.data[DOMAIN][config_entry.entry_id]
+    entity = OpenLLMAITaskEntity(config_entry, data.client)
     async_add_entities([entity])
 
 
@@ -73,6 +142,12 @@ class OpenLLMAITaskEntity(AITaskEntity):
         self._attr_name = f"{model} AI Task"
         self._client = client
 
+        # Options only change through a reload, which recreates the entity
+        self._max_tokens = int(self._get_option(CONF_MAX_TOKENS, DEFAULT_MAX_TOKENS))
+        self._temperature = float(
+            self._get_option(CONF_TEMPERATURE, DEFAULT_TEMPERATURE)
+        )
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info for this entity.
@@ -102,25 +177,26 @@ class OpenLLMAITaskEntity(AITaskEntity):
             key, self._config_entry.data.get(key, default)
         )
 
-    def _get_structure_fields(self, structure: Any) -> list[str]:
+    def _get_structure_fields(self, structure: Any) -> tuple[str, ...]:
         """Extract field names from the structure schema.
 
         Args:
             structure: The voluptuous schema or dict defining the structure.
 
         Returns:
-            List of field names from the structure.
+            Tuple of field names from the structure.
         """
         if structure is None:
-            return []
+            return ()
+
         # Try to get keys from the schema
         if hasattr(structure, "schema"):
             schema = structure.schema
             if isinstance(schema, dict):
-                return list(schema.keys())
-        if isinstance(structure, dict):
-            return list(structure.keys())
-        return []
+                return tuple(schema)
+        elif isinstance(structure, dict):
+            return tuple(structure)
+        return ()
 
     async def _async_generate_data(
         self,
@@ -137,22 +213,12 @@ class OpenLLMAITaskEntity(AITaskEntity):
             The result containing generated data.
         """
         model = self._config_entry.data.get(CONF_MODEL)
-        max_tokens = self._get_option(CONF_MAX_TOKENS, DEFAULT_MAX_TOKENS)
-        temperature = self._get_option(CONF_TEMPERATURE, DEFAULT_TEMPERATURE)
 
         # Get structure field names for better prompting
         structure_fields = self._get_structure_fields(task.structure)
 
         # Build the system prompt
-        system_prompt = AI_TASK_SYSTEM_PROMPT
-        if task.structure and structure_fields:
-            fields_str = ", ".join(f'"{f}"' for f in structure_fields)
-            system_prompt += (
-                f"\n\nIMPORTANT: You must respond with ONLY a valid JSON object. "
-                f"The JSON must have these fields: {fields_str}. "
-                f"Example format: {{{', '.join(f'\"{f}\": \"value\"' for f in structure_fields)}}}. "
-                f"Do not include any text before or after the JSON object."
-            )
+        system_prompt = _build_system_prompt(structure_fields)
 
         # Build messages
         messages: list[dict[str, str]] = [
@@ -164,8 +230,8 @@ class OpenLLMAITaskEntity(AITaskEntity):
             response_text = await self._client.chat_completion(
                 model=model,
                 messages=messages,
-                max_tokens=int(max_tokens),
-                temperature=float(temperature),
+                max_tokens=self._max_tokens,
+                temperature=self._temperature,
             )
 
             # If no structure requested, return raw text
@@ -177,15 +243,14 @@ class OpenLLMAITaskEntity(AITaskEntity):
 
             # Parse JSON response for structured output
             try:
-                # Try to extract JSON from the response
-                # Strip any markdown code blocks
-                clean_response = response_text.strip()
-                if clean_response.startswith("```"):
-                    # Remove markdown code block
-                    lines = clean_response.split("\n")
-                    clean_response = "\n".join(lines[1:-1] if lines[-1] == "```" else lines[1:])
-                data = json.loads(clean_response)
-            except json.JSONDecodeError:
+                if len(response_text) > EXECUTOR_PARSE_THRESHOLD:
+                    # Keep multi-MB decodes off the event loop
+                    data = await self.hass.async_add_executor_job(
+                        _decode_json_response, response_text
+                    )
+                else:
+                    data = _decode_json_response(response_text)
+            except orjson.JSONDecodeError:
                 # If JSON parsing fails, map the raw text to the first structure field
                 if structure_fields:
                     first_field = structure_fields[0]
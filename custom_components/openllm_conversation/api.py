@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import logging
+import re
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any, Final
 from urllib.parse import urlparse, urlunparse
 
 import aiohttp
+import orjson
 
 from .const import (
     DEFAULT_TIMEOUT,
@@ -21,6 +25,49 @@ HTTP_UNAUTHORIZED: Final = 401
 HTTP_FORBIDDEN: Final = 403
 HTTP_OK: Final = 200
 
+# Maximum number of bytes of an error response included in exceptions
+ERROR_BODY_MAX_BYTES: Final = 2048
+
+# API version path segment such as /v1, /v2 or /v1beta
+_API_VERSION_RE: Final = re.compile(r"/v\d+(?:alpha\d*|beta\d*)?(?=/|$)")
+
+# Last byte of a complete JSON object or array
+_JSON_END_BYTES: Final = (b"}", b"]")
+
+# Connection pool tuning for the shared session
+CONNECTION_LIMIT: Final = 32
+CONNECTION_LIMIT_PER_HOST: Final = 16
+KEEPALIVE_TIMEOUT: Final = 75
+DNS_CACHE_TTL: Final = 300
+
+# Response read buffer; the aiohttp default (64 KiB) pauses the transport
+# repeatedly while long completions are received
+READ_BUFFER_SIZE: Final = 4 * 1024 * 1024
+
+
+# The client deliberately stays on aiohttp rather than httpx: Home Assistant
+# already ships and pools aiohttp, and aiohttp has much lower latency under
+# concurrent OpenAI-style workloads.
+def create_session() -> aiohttp.ClientSession:
+    """Create an aiohttp session with a tuned connection pool.
+
+    Idle connections are kept alive long enough to be reused between
+    conversation turns, and the pool is bounded per host so bursts of
+    requests queue for a pooled connection instead of opening new ones. The
+    read buffer is sized so long completions are not throttled by flow
+    control while the body is being received.
+
+    Returns:
+        A new aiohttp ClientSession that owns its connector.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+    return aiohttp.ClientSession(connector=connector, read_bufsize=READ_BUFFER_SIZE)
+
 
 class OpenLLMApiError(Exception):
     """Base exception for API errors."""
@@ -34,6 +81,77 @@ class OpenLLMConnectionError(OpenLLMApiError):
     """Connection error."""
 
 
+def _parse_json(body: bytes) -> Any:
+    """Decode a JSON response body.
+
+    Args:
+        body: The raw response body.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        OpenLLMApiError: If the body is not valid JSON.
+    """
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError as err:
+        raise OpenLLMApiError(f"Invalid JSON in API response: {err}") from err
+
+
+async def _read_error_text(response: aiohttp.ClientResponse) -> str:
+    """Read the start of an error response body for diagnostics.
+
+    Error pages can be large HTML documents, so only the first
+    ERROR_BODY_MAX_BYTES bytes are read.
+
+    Args:
+        response: The failed HTTP response.
+
+    Returns:
+        The decoded start of the response body.
+    """
+    body = await response.content.read(ERROR_BODY_MAX_BYTES)
+    return body.decode("utf-8", errors="replace")
+
+
+async def _raise_for_status(response: aiohttp.ClientResponse, action: str) -> None:
+    """Raise the matching API exception for a non-200 response.
+
+    Args:
+        response: The HTTP response to check.
+        action: Description of the failed action for the error message.
+
+    Raises:
+        OpenLLMAuthError: If authentication fails.
+        OpenLLMApiError: If the API returns any other error status.
+    """
+    if response.status == HTTP_UNAUTHORIZED:
+        raise OpenLLMAuthError("Invalid API key")
+    if response.status == HTTP_FORBIDDEN:
+        raise OpenLLMAuthError("API key not authorized")
+    if response.status != HTTP_OK:
+        text = await _read_error_text(response)
+        raise OpenLLMApiError(f"{action}: {response.status} - {text}")
+
+
+def _delta_content(chunk: Any) -> str | None:
+    """Get the content fragment from a streamed chat completion chunk.
+
+    Args:
+        chunk: The decoded chunk of a streaming response.
+
+    Returns:
+        The content delta of the first choice, or None if there is none.
+    """
+    choices: list[dict[str, Any]] = chunk.get("choices") or []
+    if not choices:
+        return None
+    delta: dict[str, Any] = choices[0].get("delta") or {}
+    content: str | None = delta.get("content")
+    return content
+
+
 class OpenLLMApiClient:
     """Async client for OpenAI-compatible APIs.
 
@@ -48,6 +166,11 @@ class OpenLLMApiClient:
     base_url: str
     api_key: str | None
     timeout: aiohttp.ClientTimeout
+    _stream_timeout: aiohttp.ClientTimeout
+    _safe_url: str
+    _models_url: str
+    _chat_url: str
+    _headers: dict[str, str]
     _session: aiohttp.ClientSession | None
     _owns_session: bool
 
@@ -64,27 +187,42 @@ class OpenLLMApiClient:
             base_url: Base URL of the API (e.g., http://litellm:4000/v1).
             api_key: Optional API key for authentication.
             timeout: Request timeout in seconds.
-            session: Optional shared aiohttp session. If not provided,
-                     a new session will be created per request.
+            session: Optional shared aiohttp session. If provided, the client
+                     never closes it; otherwise a session is created on first
+                     use and closed by close().
         """
         self.base_url = self._normalize_base_url(base_url)
+        self._safe_url = self._sanitize_url_for_logging(self.base_url)
+        self._models_url = f"{self.base_url}{ENDPOINT_MODELS}"
+        self._chat_url = f"{self.base_url}{ENDPOINT_CHAT_COMPLETIONS}"
         self.api_key = api_key
+        self._headers = self._get_headers()
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        # A stream may run for longer than the timeout, so only the connect
+        # and the wait between received chunks are bounded
+        self._stream_timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=timeout, sock_read=timeout
+        )
         self._session = session
         self._owns_session = session is None
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def _normalize_base_url(base_url: str) -> str:
         """Normalize the base URL to ensure consistent format.
 
+        Results are cached, since clients are rebuilt with the same few URLs
+        on every reload.
+
         Args:
             base_url: The raw base URL input.
 
         Returns:
-            Normalized URL with trailing slash removed and /v1 path ensured.
+            Normalized URL with trailing slash removed and an API version
+            path segment ensured (/v1 is appended if none is present).
         """
         url = base_url.rstrip("/")
-        if not url.endswith("/v1") and "/v1" not in url:
+        if not url.endswith("/v1") and _API_VERSION_RE.search(url) is None:
             url = f"{url}/v1"
         return url
 
@@ -113,7 +251,10 @@ class OpenLLMApiClient:
         return url
 
     def _get_headers(self) -> dict[str, str]:
-        """Get request headers.
+        """Build request headers.
+
+        Headers only depend on the API key, so they are built once in
+        __init__ and reused for every request.
 
         Returns:
             Dictionary of HTTP headers for API requests.
@@ -131,16 +272,17 @@ class OpenLLMApiClient:
         Returns:
             An aiohttp ClientSession for making requests.
         """
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
-            self._owns_session = True
+        if self._session is None:
+            self._session = create_session()
         return self._session
 
     async def close(self) -> None:
         """Close the aiohttp session if we own it."""
-        if self._owns_session and self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        session = self._session
+        if not self._owns_session or session is None or session.closed:
+            return
+        await session.close()
+        self._session = None
 
     async def list_models(self) -> list[dict[str, Any]]:
         """Fetch available models from /v1/models.
@@ -153,24 +295,17 @@ class OpenLLMApiClient:
             OpenLLMConnectionError: If connection fails or times out.
             OpenLLMApiError: If the API returns an error.
         """
-        url = f"{self.base_url}{ENDPOINT_MODELS}"
-        safe_url = self._sanitize_url_for_logging(self.base_url)
+        safe_url = self._safe_url
         _LOGGER.debug("Fetching models from %s", safe_url)
 
         try:
             session = await self._get_session()
-            async with session.get(url, headers=self._get_headers()) as response:
-                if response.status == HTTP_UNAUTHORIZED:
-                    raise OpenLLMAuthError("Invalid API key")
-                if response.status == HTTP_FORBIDDEN:
-                    raise OpenLLMAuthError("API key not authorized")
-                if response.status != HTTP_OK:
-                    text = await response.text()
-                    raise OpenLLMApiError(
-                        f"Failed to fetch models: {response.status} - {text}"
-                    )
-
-                data = await response.json()
+            async with session.get(
+                self._models_url, headers=self._headers, timeout=self.timeout
+            ) as response:
+                await _raise_for_status(response, "Failed to fetch models")
+
+                data = _parse_json(await response.read())
                 models: list[dict[str, Any]] = data.get("data", [])
                 _LOGGER.debug("Found %d models", len(models))
                 return models
@@ -207,8 +342,7 @@ class OpenLLMApiClient:
             OpenLLMConnectionError: If connection fails or times out.
             OpenLLMApiError: If the API returns an error or no response.
         """
-        url = f"{self.base_url}{ENDPOINT_CHAT_COMPLETIONS}"
-        safe_url = self._sanitize_url_for_logging(self.base_url)
+        safe_url = self._safe_url
 
         payload: dict[str, Any] = {
             "model": model,
@@ -223,19 +357,14 @@ class OpenLLMApiClient:
         try:
             session = await self._get_session()
             async with session.post(
-                url, headers=self._get_headers(), json=payload
+                self._chat_url,
+                headers=self._headers,
+                data=orjson.dumps(payload),
+                timeout=self.timeout,
             ) as response:
-                if response.status == HTTP_UNAUTHORIZED:
-                    raise OpenLLMAuthError("Invalid API key")
-                if response.status == HTTP_FORBIDDEN:
-                    raise OpenLLMAuthError("API key not authorized")
-                if response.status != HTTP_OK:
-                    text = await response.text()
-                    raise OpenLLMApiError(
-                        f"Chat completion failed: {response.status} - {text}"
-                    )
-
-                data = await response.json()
+                await _raise_for_status(response, "Chat completion failed")
+
+                data = _parse_json(await response.read())
                 choices: list[dict[str, Any]] = data.get("choices", [])
                 if not choices:
                     raise OpenLLMApiError("No response choices returned")
@@ -254,6 +383,97 @@ class OpenLLMApiClient:
                 f"Timeout waiting for response from {safe_url}"
             ) from err
 
+    async def chat_completion_stream(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Send a streaming chat completion request.
+
+        The response is consumed as server-sent events, so content can be
+        handed to the caller as it is generated instead of after the full
+        body has been received. The timeout bounds inactivity rather than
+        the whole stream, so long generations are not cut off.
+
+        Not used by the integration yet; the conversation and AI task
+        entities call chat_completion().
+
+        Args:
+            model: Model ID to use.
+            messages: List of message dicts with 'role' and 'content'.
+            max_tokens: Maximum tokens in response.
+            temperature: Response creativity (0-2).
+            **kwargs: Additional parameters to pass to the API.
+
+        Yields:
+            Fragments of the assistant message content.
+
+        Raises:
+            OpenLLMAuthError: If authentication fails.
+            OpenLLMConnectionError: If connection fails or times out.
+            OpenLLMApiError: If the API returns an error.
+        """
+        safe_url = self._safe_url
+
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            **kwargs,
+            "stream": True,
+        }
+
+        _LOGGER.debug("Sending streaming chat completion request to %s", safe_url)
+
+        try:
+            session = await self._get_session()
+            async with session.post(
+                self._chat_url,
+                headers=self._headers,
+                data=orjson.dumps(payload),
+                timeout=self._stream_timeout,
+            ) as response:
+                await _raise_for_status(response, "Chat completion failed")
+
+                pending: list[bytes] = []
+                async for raw_line in response.content:
+                    line = raw_line.strip()
+                    if line.startswith(b"data:"):
+                        data = line[5:].lstrip()
+                        if data == b"[DONE]":
+                            break
+                        pending.append(data)
+                        # An event may split its JSON over several data lines;
+                        # only try to decode once the buffer can be complete
+                        if data[-1:] not in _JSON_END_BYTES:
+                            continue
+                        try:
+                            chunk = orjson.loads(b"\n".join(pending))
+                        except orjson.JSONDecodeError:
+                            continue
+                    elif not line and pending:
+                        # End of event: the buffered data must decode now
+                        chunk = _parse_json(b"\n".join(pending))
+                    else:
+                        continue
+
+                    pending.clear()
+                    if content := _delta_content(chunk):
+                        yield content
+
+        except aiohttp.ClientConnectorError as err:
+            raise OpenLLMConnectionError(
+                f"Failed to connect to {safe_url}: {err}"
+            ) from err
+        except TimeoutError as err:
+            raise OpenLLMConnectionError(
+                f"Timeout waiting for streamed response from {safe_url}"
+            ) from err
+
     async def test_connection(self) -> bool:
         """Test the connection to the API.
 
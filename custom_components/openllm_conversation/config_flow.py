@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
+import re
+from functools import lru_cache
 from typing import Any, Final
-from urllib.parse import urlparse
 
 import voluptuous as vol
 from homeassistant.config_entries import (
@@ -14,6 +15,7 @@ from homeassistant.config_entries import (
     OptionsFlow,
 )
 from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
     NumberSelector,
     NumberSelectorConfig,
@@ -56,22 +58,34 @@ _LOGGER = logging.getLogger(__name__)
 MANUAL_MODEL_ENTRY: Final = "__manual__"
 VALID_URL_SCHEMES: Final = frozenset({"http", "https"})
 
+# Scheme and host of an absolute URL; the host excludes any user info
+_URL_RE: Final = re.compile(
+    r"^(?P<scheme>[a-z][a-z0-9+.-]*)://(?:[^@/?#\s]*@)?(?P<host>[^@/?#\s]+)",
+    re.IGNORECASE,
+)
 
-def _build_options_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
-    """Build the options schema for agent configuration.
 
-    This helper function creates the voluptuous schema for configuring
-    the conversation agent options, avoiding duplication between the
-    initial config flow and the options flow.
+_USER_STEP_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(CONF_BASE_URL): TextSelector(
+            TextSelectorConfig(type=TextSelectorType.URL)
+        ),
+        vol.Optional(CONF_API_KEY): TextSelector(
+            TextSelectorConfig(type=TextSelectorType.PASSWORD)
+        ),
+    }
+)
+
+
+def _create_options_schema(defaults: dict[str, Any]) -> vol.Schema:
+    """Create the options schema for agent configuration.
 
     Args:
-        defaults: Optional dictionary of default values for the form fields.
+        defaults: Dictionary of default values for the form fields.
 
     Returns:
         A voluptuous Schema for the options form.
     """
-    defaults = defaults or {}
-
     return vol.Schema(
         {
             vol.Optional(
@@ -126,6 +140,43 @@ def _build_options_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
     )
 
 
+_DEFAULT_OPTIONS_SCHEMA: Final = _create_options_schema({})
+
+
+@lru_cache(maxsize=32)
+def _create_options_schema_cached(
+    defaults_items: tuple[tuple[str, Any], ...],
+) -> vol.Schema:
+    """Create the options schema for a set of defaults, cached.
+
+    Args:
+        defaults_items: Sorted (key, value) pairs of the form defaults.
+
+    Returns:
+        A voluptuous Schema for the options form.
+    """
+    return _create_options_schema(dict(defaults_items))
+
+
+def _build_options_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
+    """Build the options schema for agent configuration.
+
+    This helper function creates the voluptuous schema for configuring
+    the conversation agent options, avoiding duplication between the
+    initial config flow and the options flow. Schemas only depend on the
+    defaults, so they are built once per distinct set of defaults.
+
+    Args:
+        defaults: Optional dictionary of default values for the form fields.
+
+    Returns:
+        A voluptuous Schema for the options form.
+    """
+    if not defaults:
+        return _DEFAULT_OPTIONS_SCHEMA
+    return _create_options_schema_cached(tuple(sorted(defaults.items())))
+
+
 def _validate_url(url: str) -> str | None:
     """Validate a URL and return an error key if invalid.
 
@@ -135,17 +186,63 @@ def _validate_url(url: str) -> str | None:
     Returns:
         An error key string if validation fails, None if valid.
     """
-    try:
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            return "invalid_url_format"
-        if parsed.scheme not in VALID_URL_SCHEMES:
-            return "invalid_url_scheme"
-    except Exception:  # noqa: BLE001
+    match = _URL_RE.match(url)
+    if match is None:
         return "invalid_url_format"
+    if match["scheme"].lower() not in VALID_URL_SCHEMES:
+        return "invalid_url_scheme"
     return None
 
 
+def _build_model_options(models: list[dict[str, Any]]) -> list[dict[str, str]]:
+    """Build the model selector options.
+
+    Args:
+        models: Model objects returned by the API.
+
+    Returns:
+        Select options for each model, followed by the manual entry option.
+    """
+    model_options: list[dict[str, str]] = [
+        {"value": model_id, "label": model_id}
+        for m in models
+        if (model_id := m.get("id"))
+    ]
+
+    # Always add manual entry option
+    model_options.append(
+        {"value": MANUAL_MODEL_ENTRY, "label": "Enter model manually..."}
+    )
+    return model_options
+
+
+def _build_model_schema(models: list[dict[str, Any]], manual_entry: bool) -> vol.Schema:
+    """Build the model selection schema.
+
+    Args:
+        models: Model objects returned by the API.
+        manual_entry: Whether to show the manual model entry field.
+
+    Returns:
+        A voluptuous Schema for the model form.
+    """
+    schema_dict: dict[vol.Marker, Any] = {
+        vol.Optional(CONF_MODEL): SelectSelector(
+            SelectSelectorConfig(
+                options=_build_model_options(models),
+                mode=SelectSelectorMode.DROPDOWN,
+            )
+        ),
+    }
+
+    if manual_entry:
+        schema_dict[vol.Optional("manual_model")] = TextSelector(
+            TextSelectorConfig(type=TextSelectorType.TEXT)
+        )
+
+    return vol.Schema(schema_dict)
+
+
 class OpenLLMConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     """Handle a config flow for OpenLLM Conversation.
 
@@ -158,19 +255,15 @@ class OpenLLMConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
 
     VERSION: int = 1
 
-    _base_url: str | None
-    _api_key: str | None
+    # Immutable defaults live on the class; _models is assigned per instance
+    # in the user step before the model step can run
+    _base_url: str | None = None
+    _unique_base: str = ""
+    _api_key: str | None = None
     _models: list[dict[str, Any]]
-    _model_fetch_failed: bool
-    _selected_model: str
-
-    def __init__(self) -> None:
-        """Initialize the config flow."""
-        self._base_url = None
-        self._api_key = None
-        self._models = []
-        self._model_fetch_failed = False
-        self._selected_model = ""
+    _model_schema: vol.Schema | None = None
+    _model_fetch_failed: bool = False
+    _selected_model: str = ""
 
     @staticmethod
     @callback
@@ -207,19 +300,23 @@ class OpenLLMConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                 errors[CONF_BASE_URL] = url_error
             else:
                 self._base_url = base_url
+                # Normalized once for duplicate detection in the model step
+                self._unique_base = base_url.rstrip("/").lower()
                 self._api_key = user_input.get(CONF_API_KEY)
 
                 # Warn about insecure HTTP (but don't block)
-                parsed = urlparse(base_url)
-                if parsed.scheme == "http":
+                match = _URL_RE.match(base_url)
+                if match and match["scheme"].lower() == "http":
                     _LOGGER.warning(
-                        "Using insecure HTTP connection to %s", parsed.netloc
+                        "Using insecure HTTP connection to %s", match["host"]
                     )
 
-                # Test connection and fetch models
+                # Test connection and fetch models over Home Assistant's
+                # pooled session instead of a throwaway one
                 client = OpenLLMApiClient(
                     base_url=self._base_url,
                     api_key=self._api_key,
+                    session=async_get_clientsession(self.hass),
                 )
 
                 try:
@@ -234,24 +331,18 @@ class OpenLLMConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                     # Allow proceeding with manual model entry
                     self._models = []
                     self._model_fetch_failed = True
-                finally:
-                    await client.close()
 
             if not errors:
+                # The model form only depends on the fetched models, so it
+                # is built once and reused when the form is shown again
+                # Show manual entry field if model fetch failed or no models found
+                manual_entry = self._model_fetch_failed or not self._models
+                self._model_schema = _build_model_schema(self._models, manual_entry)
                 return await self.async_step_model()
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_BASE_URL): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.URL)
-                    ),
-                    vol.Optional(CONF_API_KEY): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.PASSWORD)
-                    ),
-                }
-            ),
+            data_schema=_USER_STEP_SCHEMA,
             errors=errors,
             description_placeholders={
                 "example_url": "http://litellm:4000/v1",
@@ -283,45 +374,16 @@ class OpenLLMConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                 errors["base"] = "no_model_selected"
             else:
                 # Check for duplicate entry (same endpoint + model)
-                unique_id = f"{self._base_url.lower().rstrip('/')}_{model}"
+                unique_id = f"{self._unique_base}_{model}"
                 await self.async_set_unique_id(unique_id)
                 self._abort_if_unique_id_configured()
 
                 self._selected_model = model
                 return await self.async_step_configure()
 
-        # Build model options
-        model_options: list[dict[str, str]] = []
-        if self._models:
-            model_options = [
-                {"value": m.get("id", ""), "label": m.get("id", "Unknown")}
-                for m in self._models
-                if m.get("id")
-            ]
-
-        # Always add manual entry option
-        model_options.append(
-            {"value": MANUAL_MODEL_ENTRY, "label": "Enter model manually..."}
-        )
-
-        schema_dict: dict[vol.Marker, Any] = {
-            vol.Optional(CONF_MODEL): SelectSelector(
-                SelectSelectorConfig(
-                    options=model_options,
-                    mode=SelectSelectorMode.DROPDOWN,
-                )
-            ),
-        }
-
-        # Show manual entry field if model fetch failed or no models found
-        if self._model_fetch_failed or not self._models:
-            schema_dict[vol.Optional("manual_model")] = TextSelector(
-                TextSelectorConfig(type=TextSelectorType.TEXT)
-            )
-
         return self.async_show_form(
             step_id="model",
-            data_schema=vol.Schema(schema_dict),
+            data_schema=self._model_schema,
             errors=errors,
             description_placeholders={
                 "model_count": str(len(self._models)),
@@ -2,6 +2,11 @@
 
 DOMAIN = "openllm_conversation"
 
+# hass.data[DOMAIN] key for the aiohttp session shared by all config entries
+DATA_SESSION = "_session"
+# hass.data[DOMAIN] key for the listener that closes the session on shutdown
+DATA_SESSION_CLOSE_LISTENER = "_session_close_listener"
+
 # Configuration keys
 CONF_BASE_URL = "base_url"
 CONF_API_KEY = "api_key"
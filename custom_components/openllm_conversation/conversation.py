@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from collections.abc import Iterable
+from itertools import islice
 from typing import Any, Final, Literal
 
 from homeassistant.components import conversation
@@ -15,6 +19,7 @@ from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import ulid
 
+from . import OpenLLMData
 from .api import OpenLLMApiClient, OpenLLMApiError
 from .const import (
     CONF_CONTEXT_MESSAGES,
@@ -32,31 +37,47 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 # Memory management constants
-CONVERSATION_TIMEOUT: Final = timedelta(hours=24)
+CONVERSATION_TIMEOUT_SEC: Final = 24 * 3600.0
 MAX_CONVERSATIONS: Final = 100
+# Number of turns between scans for expired conversations
+CLEANUP_INTERVAL: Final = 32
+
+# Message keys and roles shared by every message dict and history entry.
+# Identifier-like literals are already interned by the compiler, so these
+# need no sys.intern() call.
+_ROLE: Final = "role"
+_CONTENT: Final = "content"
+_USER: Final = "user"
+_ASSISTANT: Final = "assistant"
+_SYSTEM: Final = "system"
 
 
 class ConversationData:
     """Container for conversation history data.
 
     Attributes:
-        messages: List of message dictionaries with role and content.
-        last_used: Timestamp of last interaction.
+        messages: Bounded queue of (role, content) tuples; the oldest
+            messages are dropped once it is full.
+        last_used: Monotonic clock reading of the last interaction.
     """
 
-    messages: list[dict[str, str]]
-    last_used: datetime
+    messages: deque[tuple[str, str]]
+    last_used: float
 
     __slots__ = ("messages", "last_used")
 
-    def __init__(self) -> None:
-        """Initialize conversation data."""
-        self.messages = []
-        self.last_used = datetime.now()
+    def __init__(self, max_messages: int) -> None:
+        """Initialize conversation data.
+
+        Args:
+            max_messages: Maximum number of messages to keep.
+        """
+        self.messages = deque(maxlen=max_messages)
+        self.last_used = time.monotonic()
 
     def touch(self) -> None:
         """Update last used timestamp."""
-        self.last_used = datetime.now()
+        self.last_used = time.monotonic()
 
 
 async def async_setup_entry(
@@ -71,8 +92,8 @@ async def async_setup_entry(
         config_entry: The config entry for this integration.
         async_add_entities: Callback to add entities to Home Assistant.
     """
-    client: OpenLLMApiClient = hass.data[DOMAIN][config_entry.entry_id]["client"]
-    agent = OpenLLMConversationEntity(config_entry, client)
+    data: OpenLLMData = hass.data[DOMAIN][config_entry.entry_id]
+    agent = OpenLLMConversationEntity(config_entry, data.client)
     async_add_entities([agent])
 
 
@@ -94,6 +115,15 @@ class OpenLLMConversationEntity(
     config_entry: ConfigEntry
     _client: OpenLLMApiClient
     _conversation_history: dict[str, ConversationData]
+    _turns_since_cleanup: int
+    _merged_config: dict[str, Any]
+    _model: str | None
+    _max_tokens: int
+    _temperature: float
+    _context_messages: int
+    _max_history: int
+    _max_history_size: int
+    _system_message: dict[str, str]
 
     def __init__(self, config_entry: ConfigEntry, client: OpenLLMApiClient) -> None:
         """Initialize the conversation entity.
@@ -106,19 +136,33 @@ class OpenLLMConversationEntity(
         self._attr_unique_id = config_entry.entry_id
         self._client = client
         self._conversation_history = {}
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this entity.
-
-        Returns:
-            Device information for the device registry.
-        """
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.config_entry.entry_id)},
-            name=self.config_entry.title,
+        self._turns_since_cleanup = 0
+
+        # Options only change through a reload, which recreates the entity,
+        # so the merged configuration can be snapshotted once
+        self._merged_config = {**config_entry.data, **config_entry.options}
+        self._model = config_entry.data.get(CONF_MODEL)
+        self._max_tokens = int(self._get_option(CONF_MAX_TOKENS, DEFAULT_MAX_TOKENS))
+        self._temperature = float(
+            self._get_option(CONF_TEMPERATURE, DEFAULT_TEMPERATURE)
+        )
+        self._context_messages = int(
+            self._get_option(CONF_CONTEXT_MESSAGES, DEFAULT_CONTEXT_MESSAGES)
+        )
+        # Each turn has 2 messages (user + assistant), so multiply by 2
+        self._max_history = self._context_messages * 2
+        # Messages kept per conversation: the context window plus a margin
+        self._max_history_size = (self._context_messages + 5) * 2
+        # Shared by every request; must not be mutated
+        self._system_message = {
+            _ROLE: _SYSTEM,
+            _CONTENT: self._get_option(CONF_PROMPT_TEMPLATE, DEFAULT_PROMPT_TEMPLATE),
+        }
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=config_entry.title,
             manufacturer="OpenLLM",
-            model=self.config_entry.data.get(CONF_MODEL, "Unknown"),
+            model=config_entry.data.get(CONF_MODEL, "Unknown"),
             entry_type=DeviceEntryType.SERVICE,
         )
 
@@ -141,23 +185,22 @@ class OpenLLMConversationEntity(
         Returns:
             The configuration value.
         """
-        return self.config_entry.options.get(
-            key, self.config_entry.data.get(key, default)
-        )
+        return self._merged_config.get(key, default)
 
     def _cleanup_old_conversations(self) -> None:
         """Remove old conversation history to prevent memory leaks.
 
-        Removes conversations that haven't been used within CONVERSATION_TIMEOUT,
-        and also limits total conversations to MAX_CONVERSATIONS.
+        Removes conversations that haven't been used within
+        CONVERSATION_TIMEOUT_SEC, and also limits total conversations to
+        MAX_CONVERSATIONS.
         """
-        now = datetime.now()
+        now = time.monotonic()
 
         # Remove timed-out conversations
         to_remove = [
             conv_id
             for conv_id, data in self._conversation_history.items()
-            if now - data.last_used > CONVERSATION_TIMEOUT
+            if now - data.last_used > CONVERSATION_TIMEOUT_SEC
         ]
         for conv_id in to_remove:
             del self._conversation_history[conv_id]
@@ -165,12 +208,13 @@ class OpenLLMConversationEntity(
 
         # Limit total conversations
         if len(self._conversation_history) > MAX_CONVERSATIONS:
-            # Sort by last used and keep only the most recent
-            sorted_convs = sorted(
+            # Drop only the least recently used overflow entries
+            oldest_convs = heapq.nsmallest(
+                len(self._conversation_history) - MAX_CONVERSATIONS,
                 self._conversation_history.items(),
                 key=lambda x: x[1].last_used,
             )
-            for conv_id, _ in sorted_convs[:-MAX_CONVERSATIONS]:
+            for conv_id, _ in oldest_convs:
                 del self._conversation_history[conv_id]
             _LOGGER.debug(
                 "Trimmed conversation history to %d entries", MAX_CONVERSATIONS
@@ -204,45 +248,58 @@ class OpenLLMConversationEntity(
             The conversation result with the assistant's response.
         """
         # Cleanup old conversations periodically
-        self._cleanup_old_conversations()
+        self._turns_since_cleanup += 1
+        if (
+            self._turns_since_cleanup >= CLEANUP_INTERVAL
+            or len(self._conversation_history) > MAX_CONVERSATIONS
+        ):
+            self._cleanup_old_conversations()
+            self._turns_since_cleanup = 0
 
         # Get configuration
-        model = self.config_entry.data.get(CONF_MODEL)
-        prompt_template = self._get_option(
-            CONF_PROMPT_TEMPLATE, DEFAULT_PROMPT_TEMPLATE
-        )
-        max_tokens = self._get_option(CONF_MAX_TOKENS, DEFAULT_MAX_TOKENS)
-        temperature = self._get_option(CONF_TEMPERATURE, DEFAULT_TEMPERATURE)
-        context_messages = self._get_option(
-            CONF_CONTEXT_MESSAGES, DEFAULT_CONTEXT_MESSAGES
-        )
-
-        # Get or create conversation ID
-        conversation_id = user_input.conversation_id or ulid.ulid_now()
-
-        # Get or create conversation history
-        if conversation_id not in self._conversation_history:
-            self._conversation_history[conversation_id] = ConversationData()
-
-        conv_data = self._conversation_history[conversation_id]
-        conv_data.touch()
+        model = self._model
+        max_history = self._max_history
+        conversation_history = self._conversation_history
+
+        # Get or create conversation ID and history
+        conversation_id = user_input.conversation_id
+        if not conversation_id:
+            # A new ID cannot have history yet, so skip the lookup
+            conversation_id = ulid.ulid_now()
+            conv_data = ConversationData(self._max_history_size)
+            conversation_history[conversation_id] = conv_data
+        else:
+            conv_data = conversation_history.get(conversation_id)
+            # Expired conversations are only swept every CLEANUP_INTERVAL
+            # turns, so one that timed out is replaced here with fresh history
+            if (
+                conv_data is None
+                or time.monotonic() - conv_data.last_used > CONVERSATION_TIMEOUT_SEC
+            ):
+                conv_data = ConversationData(self._max_history_size)
+                conversation_history[conversation_id] = conv_data
+            else:
+                conv_data.touch()
 
-        # Build messages list
+        # Add conversation history (limited by context_messages)
+        history = conv_data.messages
+        history_len = len(history)
+        recent_history: Iterable[tuple[str, str]] = ()
+        if max_history > 0 and history_len:
+            if history_len <= max_history:
+                recent_history = history
+            else:
+                recent_history = islice(history, history_len - max_history, history_len)
+
+        # Build messages list: system prompt, recent history, current message
         messages: list[dict[str, str]] = [
-            {"role": "system", "content": prompt_template}
+            self._system_message,
+            *({_ROLE: role, _CONTENT: content} for role, content in recent_history),
+            {_ROLE: _USER, _CONTENT: user_input.text},
         ]
 
-        # Add conversation history (limited by context_messages)
-        context_messages = int(context_messages)
-        if context_messages > 0 and conv_data.messages:
-            # Each turn has 2 messages (user + assistant), so multiply by 2
-            max_history = context_messages * 2
-            messages.extend(conv_data.messages[-max_history:])
-
-        # Add current user message
-        messages.append({"role": "user", "content": user_input.text})
-
-        # Trace the request
+        # Trace the request; this is a no-op when no conversation trace is
+        # active, and the payload only wraps the already-built messages list
         trace.async_conversation_trace_append(
             trace.ConversationTraceEventType.AGENT_DETAIL,
             {"messages": messages, "model": model},
@@ -253,18 +310,13 @@ class OpenLLMConversationEntity(
             response_text = await self._client.chat_completion(
                 model=model,
                 messages=messages,
-                max_tokens=int(max_tokens),
-                temperature=float(temperature),
+                max_tokens=self._max_tokens,
+                temperature=self._temperature,
             )
 
-            # Update conversation history
-            conv_data.messages.append({"role": "user", "content": user_input.text})
-            conv_data.messages.append({"role": "assistant", "content": response_text})
-
-            # Limit history size within conversation
-            max_history_size = (context_messages + 5) * 2
-            if len(conv_data.messages) > max_history_size:
-                conv_data.messages = conv_data.messages[-max_history_size:]
+            # Update conversation history (the deque drops the oldest messages)
+            history.append((_USER, user_input.text))
+            history.append((_ASSISTANT, response_text))
 
             # Create response
             intent_response = intent.IntentResponse(language=user_input.language)
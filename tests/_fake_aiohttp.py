@@ -0,0 +1,95 @@
+"""Lightweight aiohttp stand-ins for API client tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+
+class FakeStreamReader:
+    """Minimal stand-in for aiohttp.StreamReader."""
+
+    def __init__(self, body: bytes, lines: list[bytes]) -> None:
+        """Initialize the reader.
+
+        Args:
+            body: Bytes returned by read().
+            lines: Lines yielded when iterating, as for streamed responses.
+        """
+        self._body = body
+        self._lines = lines
+
+    async def read(self, n: int = -1) -> bytes:
+        """Return up to n bytes of the body, or all of it if n is negative."""
+        return self._body if n < 0 else self._body[:n]
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yield the configured lines."""
+        for line in self._lines:
+            yield line
+
+
+class FakeResponse:
+    """Minimal stand-in for aiohttp.ClientResponse."""
+
+    def __init__(
+        self, status: int = 200, body: bytes = b"", lines: list[bytes] | None = None
+    ) -> None:
+        """Initialize the response.
+
+        Args:
+            status: HTTP status code.
+            body: Response body.
+            lines: Lines of a streamed response body.
+        """
+        self.status = status
+        self._body = body
+        self.content = FakeStreamReader(body, lines or [])
+
+    async def read(self) -> bytes:
+        """Return the whole response body."""
+        return self._body
+
+    async def __aenter__(self) -> FakeResponse:
+        """Enter the request context."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Exit the request context."""
+
+
+class FakeSession:
+    """Minimal stand-in for aiohttp.ClientSession.
+
+    Attributes:
+        responses: Response returned for each HTTP method.
+        calls: (method, url, kwargs) of every request made.
+        closed: Whether close() was called.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the session."""
+        self.responses: dict[str, FakeResponse] = {}
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+        self.closed = False
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        """Record a request and return the response set for its method."""
+        self.calls.append((method, url, kwargs))
+        return self.responses[method]
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        """Make a GET request."""
+        return self._request("get", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        """Make a POST request."""
+        return self._request("post", url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the session."""
+        self.closed = True
+
+
+# Sets the response for a session method: (status, body, method, lines)
+MockSessionFactory = Callable[..., FakeResponse]
@@ -2,46 +2,37 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
 
+import orjson
 import pytest
-from homeassistant.core import HomeAssistant
 
+from custom_components.openllm_conversation.api import OpenLLMApiClient
 from custom_components.openllm_conversation.const import (
     CONF_API_KEY,
     CONF_BASE_URL,
     CONF_MODEL,
 )
 
+from ._fake_aiohttp import FakeResponse, FakeSession, MockSessionFactory
 
-@pytest.fixture(autouse=True)
-def auto_enable_custom_integrations(hass: HomeAssistant, enable_custom_integrations):
-    """Enable custom integrations for all tests.
-
-    This fixture ensures the enable_custom_integrations fixture from
-    pytest-homeassistant-custom-component runs before our tests.
-    The hass dependency ensures Home Assistant is set up first.
-    """
-    # Mock the conversation component to avoid dependency issues
-    hass.data["conversation"] = {}
-    hass.config.components.add("conversation")
-    yield
-
-
-@pytest.fixture
-def mock_models_response() -> list[dict[str, Any]]:
-    """Return mock models response."""
-    return [
-        {"id": "gpt-4o", "object": "model", "owned_by": "openai"},
-        {"id": "gpt-3.5-turbo", "object": "model", "owned_by": "openai"},
-        {"id": "claude-3-opus", "object": "model", "owned_by": "anthropic"},
-    ]
-
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
 
-@pytest.fixture
-def mock_chat_response() -> dict[str, Any]:
-    """Return mock chat completion response."""
-    return {
+# Shared mock payloads, built once at import. Only the top level is
+# read-only (a tuple and a mappingproxy); the nested dicts are shared across
+# tests and must not be mutated.
+MOCK_MODELS: Final = (
+    {"id": "gpt-4o", "object": "model", "owned_by": "openai"},
+    {"id": "gpt-3.5-turbo", "object": "model", "owned_by": "openai"},
+    {"id": "claude-3-opus", "object": "model", "owned_by": "anthropic"},
+)
+# Serialized /models response body shared by the API tests
+MOCK_MODELS_BODY: Final = orjson.dumps({"data": MOCK_MODELS})
+MOCK_CHAT_RESPONSE: Final = MappingProxyType(
+    {
         "id": "chatcmpl-123",
         "object": "chat.completion",
         "created": 1677652288,
@@ -62,6 +53,85 @@ def mock_chat_response() -> dict[str, Any]:
             "total_tokens": 21,
         },
     }
+)
+# Serialized chat completion body; orjson cannot encode a mappingproxy
+MOCK_CHAT_RESPONSE_BODY: Final = orjson.dumps(dict(MOCK_CHAT_RESPONSE))
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(hass: HomeAssistant, enable_custom_integrations):
+    """Enable custom integrations for all tests.
+
+    This fixture ensures the enable_custom_integrations fixture from
+    pytest-homeassistant-custom-component runs before our tests.
+    The hass dependency ensures Home Assistant is set up first.
+    """
+    # Mock the conversation component to avoid dependency issues
+    hass.data["conversation"] = {}
+    hass.config.components.add("conversation")
+    yield
+
+
+@pytest.fixture
+def mock_session() -> FakeSession:
+    """Return a fake aiohttp session for the API client."""
+    return FakeSession()
+
+
+@pytest.fixture
+def api_client(mock_session: FakeSession) -> OpenLLMApiClient:
+    """Return an API client that sends requests through the fake session.
+
+    The session is passed in, so the client does not own it and there is
+    nothing to close after the test.
+    """
+    return OpenLLMApiClient("http://localhost:4000/v1", session=mock_session)
+
+
+@pytest.fixture
+def mock_session_factory(mock_session: FakeSession) -> MockSessionFactory:
+    """Return a factory that sets the fake session's response.
+
+    The factory takes the response status, the body, the session method to
+    answer ("get" or "post") and, for streamed responses, the body lines.
+    It returns the response.
+    """
+
+    def _make(
+        status: int = 200,
+        body: bytes = b"",
+        method: str = "get",
+        lines: list[bytes] | None = None,
+    ) -> FakeResponse:
+        response = FakeResponse(status, body, lines)
+        mock_session.responses[method] = response
+        return response
+
+    return _make
+
+
+@pytest.fixture
+def mock_models_response() -> tuple[dict[str, Any], ...]:
+    """Return mock models response."""
+    return MOCK_MODELS
+
+
+@pytest.fixture
+def mock_models_body() -> bytes:
+    """Return the serialized mock models response body."""
+    return MOCK_MODELS_BODY
+
+
+@pytest.fixture
+def mock_chat_response() -> Mapping[str, Any]:
+    """Return mock chat completion response."""
+    return MOCK_CHAT_RESPONSE
+
+
+@pytest.fixture
+def mock_chat_response_body() -> bytes:
+    """Return the serialized mock chat completion response body."""
+    return MOCK_CHAT_RESPONSE_BODY
 
 
 @pytest.fixture
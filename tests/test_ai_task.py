@@ -0,0 +1,95 @@
+"""Tests for the AI Task entity."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+import voluptuous as vol
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openllm_conversation.ai_task import (
+    EXECUTOR_PARSE_THRESHOLD,
+    OpenLLMAITaskEntity,
+    _decode_json_response,
+)
+from custom_components.openllm_conversation.const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+@pytest.mark.parametrize(
+    ("response_text", "expected"),
+    [
+        ('{"a": 1}', {"a": 1}),
+        ('  {"a": 1}\n', {"a": 1}),
+        ('```\n{"a": 1}\n```', {"a": 1}),
+        ('```json\n{"a": 1}\n```', {"a": 1}),
+        ('```json\n{"a": 1}', {"a": 1}),
+        ('Here you go: {"a": 1} Hope that helps!', {"a": 1}),
+        ('```json\nSure: {"a": 1}\n```', {"a": 1}),
+    ],
+    ids=[
+        "plain",
+        "whitespace",
+        "fenced",
+        "language_tagged",
+        "unclosed_fence",
+        "prose_wrapped",
+        "fenced_prose_wrapped",
+    ],
+)
+def test_decode_json_response(response_text: str, expected: Any) -> None:
+    """Test JSON is decoded from fenced and prose-wrapped responses."""
+    assert _decode_json_response(response_text) == expected
+
+
+@pytest.mark.parametrize(
+    "response_text",
+    ["Just some text", 'Here {is} {"a":1}', "```json\nnot json\n```", "{" * 100_000],
+    ids=["no_json", "unbalanced_prose", "fenced_text", "unclosed_braces"],
+)
+def test_decode_json_response_invalid(response_text: str) -> None:
+    """Test responses without salvageable JSON raise for the field fallback."""
+    with pytest.raises(orjson.JSONDecodeError):
+        _decode_json_response(response_text)
+
+
+@pytest.mark.parametrize(
+    ("padding", "in_executor"),
+    [(0, False), (EXECUTOR_PARSE_THRESHOLD, True)],
+    ids=["short", "long"],
+)
+async def test_generate_data_executor_parse(
+    hass: HomeAssistant,
+    mock_config_entry_data: dict[str, Any],
+    padding: int,
+    in_executor: bool,
+) -> None:
+    """Test only responses past the threshold are decoded in the executor."""
+    response_text = '{"a": "' + "x" * padding + '"}'
+    client = MagicMock()
+    client.chat_completion = AsyncMock(return_value=response_text)
+    entity = OpenLLMAITaskEntity(
+        MockConfigEntry(domain=DOMAIN, data=mock_config_entry_data), client
+    )
+    entity.hass = hass
+    task = SimpleNamespace(
+        instructions="Generate data", structure=vol.Schema({vol.Required("a"): str})
+    )
+    chat_log = MagicMock(conversation_id="conv")
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor_job:
+        result = await entity._async_generate_data(task, chat_log)
+
+    assert result.data == {"a": "x" * padding}
+    if in_executor:
+        mock_executor_job.assert_called_once_with(_decode_json_response, response_text)
+    else:
+        mock_executor_job.assert_not_called()
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
 from custom_components.openllm_conversation.api import (
@@ -12,21 +12,31 @@ from custom_components.openllm_conversation.api import (
     OpenLLMApiError,
     OpenLLMAuthError,
 )
-
-
-def test_normalize_base_url() -> None:
+from custom_components.openllm_conversation.const import DEFAULT_TIMEOUT
+
+from ._fake_aiohttp import FakeSession, MockSessionFactory
+
+
+@pytest.mark.parametrize(
+    ("base_url", "expected"),
+    [
+        # Without /v1
+        ("http://localhost:4000", "http://localhost:4000/v1"),
+        # With /v1
+        ("http://localhost:4000/v1", "http://localhost:4000/v1"),
+        # With trailing slash
+        ("http://localhost:4000/v1/", "http://localhost:4000/v1"),
+        # Other API version segments are kept as-is
+        ("https://example.com/v1beta/openai/", "https://example.com/v1beta/openai"),
+        ("http://localhost:4000/v2", "http://localhost:4000/v2"),
+        # A "v1" host name is not an API version segment
+        ("http://v1.example.com", "http://v1.example.com/v1"),
+    ],
+)
+def test_normalize_base_url(base_url: str, expected: str) -> None:
     """Test URL normalization."""
-    # Without /v1
-    client = OpenLLMApiClient("http://localhost:4000")
-    assert client.base_url == "http://localhost:4000/v1"
-
-    # With /v1
-    client = OpenLLMApiClient("http://localhost:4000/v1")
-    assert client.base_url == "http://localhost:4000/v1"
-
-    # With trailing slash
-    client = OpenLLMApiClient("http://localhost:4000/v1/")
-    assert client.base_url == "http://localhost:4000/v1"
+    client = OpenLLMApiClient(base_url)
+    assert client.base_url == expected
 
 
 def test_sanitize_url_for_logging() -> None:
@@ -65,102 +75,91 @@ def test_headers_without_api_key() -> None:
     assert headers["Content-Type"] == "application/json"
 
 
-async def test_list_models_success() -> None:
+async def test_list_models_success(
+    api_client: OpenLLMApiClient,
+    mock_session_factory: MockSessionFactory,
+    mock_models_body: bytes,
+) -> None:
     """Test successful model listing."""
-    mock_response = AsyncMock()
-    mock_response.status = 200
-    mock_response.json = AsyncMock(
-        return_value={
-            "data": [
-                {"id": "gpt-4o", "object": "model"},
-                {"id": "gpt-3.5-turbo", "object": "model"},
-            ]
-        }
-    )
-    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_response.__aexit__ = AsyncMock(return_value=None)
+    mock_session_factory(body=mock_models_body)
 
-    mock_session = MagicMock()
-    mock_session.get = MagicMock(return_value=mock_response)
-    mock_session.closed = False
-    mock_session.close = AsyncMock()
+    models = await api_client.list_models()
 
-    client = OpenLLMApiClient("http://localhost:4000/v1")
-    client._session = mock_session
-    client._owns_session = False  # Don't try to close our mock
-
-    models = await client.list_models()
-
-    assert len(models) == 2
+    assert len(models) == 3
     assert models[0]["id"] == "gpt-4o"
 
 
-async def test_list_models_auth_error() -> None:
-    """Test auth error on model listing."""
-    mock_response = AsyncMock()
-    mock_response.status = 401
-    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_response.__aexit__ = AsyncMock(return_value=None)
-
-    mock_session = MagicMock()
-    mock_session.get = MagicMock(return_value=mock_response)
-    mock_session.closed = False
-
-    client = OpenLLMApiClient("http://localhost:4000/v1", api_key="bad-key")
-    client._session = mock_session
-    client._owns_session = False
-
-    with pytest.raises(OpenLLMAuthError):
-        await client.list_models()
-
-
-async def test_list_models_forbidden() -> None:
-    """Test forbidden error on model listing."""
-    mock_response = AsyncMock()
-    mock_response.status = 403
-    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_response.__aexit__ = AsyncMock(return_value=None)
-
-    mock_session = MagicMock()
-    mock_session.get = MagicMock(return_value=mock_response)
-    mock_session.closed = False
-
-    client = OpenLLMApiClient("http://localhost:4000/v1")
-    client._session = mock_session
-    client._owns_session = False
-
-    with pytest.raises(OpenLLMAuthError):
-        await client.list_models()
-
-
-async def test_chat_completion_success() -> None:
-    """Test successful chat completion."""
-    mock_response = AsyncMock()
-    mock_response.status = 200
-    mock_response.json = AsyncMock(
-        return_value={
-            "choices": [
-                {
-                    "message": {
-                        "role": "assistant",
-                        "content": "Hello! How can I help you today?",
-                    }
-                }
-            ]
-        }
+async def _call_api(client: OpenLLMApiClient, method: str) -> Any:
+    """Call the client endpoint that uses the given HTTP method."""
+    if method == "get":
+        return await client.list_models()
+    return await client.chat_completion(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "Hello"}],
     )
-    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_response.__aexit__ = AsyncMock(return_value=None)
 
-    mock_session = MagicMock()
-    mock_session.post = MagicMock(return_value=mock_response)
-    mock_session.closed = False
 
-    client = OpenLLMApiClient("http://localhost:4000/v1")
-    client._session = mock_session
-    client._owns_session = False
+@pytest.mark.parametrize(
+    ("method", "status", "body", "exc", "match"),
+    [
+        ("get", 401, b"", OpenLLMAuthError, "Invalid API key"),
+        ("get", 403, b"", OpenLLMAuthError, "not authorized"),
+        ("post", 401, b"", OpenLLMAuthError, "Invalid API key"),
+        ("post", 200, b'{"choices": []}', OpenLLMApiError, "No response choices"),
+        (
+            "post",
+            200,
+            b'{"choices": [], "error": {"content": "oops"}}',
+            OpenLLMApiError,
+            "No response choices",
+        ),
+    ],
+    ids=[
+        "list_models_auth_error",
+        "list_models_forbidden",
+        "chat_completion_auth_error",
+        "chat_completion_no_choices",
+        "chat_completion_no_choices_error_content",
+    ],
+)
+async def test_api_errors(
+    api_client: OpenLLMApiClient,
+    mock_session_factory: MockSessionFactory,
+    method: str,
+    status: int,
+    body: bytes,
+    exc: type[Exception],
+    match: str,
+) -> None:
+    """Test API error responses raise the matching exception."""
+    mock_session_factory(status=status, body=body, method=method)
+
+    with pytest.raises(exc, match=match):
+        await _call_api(api_client, method)
+
+
+async def test_list_models_server_error(
+    api_client: OpenLLMApiClient, mock_session_factory: MockSessionFactory
+) -> None:
+    """Test server error on model listing includes the error body."""
+    mock_session_factory(status=500, body=b"Internal Server Error" + b"." * 4096)
+
+    with pytest.raises(OpenLLMApiError, match="500 - Internal Server Error") as err:
+        await api_client.list_models()
+
+    # Only the start of a large error page is read
+    assert len(str(err.value).partition(" - ")[2]) == 2048
+
+
+async def test_chat_completion_success(
+    api_client: OpenLLMApiClient,
+    mock_session_factory: MockSessionFactory,
+    mock_chat_response_body: bytes,
+) -> None:
+    """Test successful chat completion."""
+    mock_session_factory(method="post", body=mock_chat_response_body)
 
-    response = await client.chat_completion(
+    response = await api_client.chat_completion(
         model="gpt-4o",
         messages=[{"role": "user", "content": "Hello"}],
     )
@@ -168,67 +167,113 @@ async def test_chat_completion_success() -> None:
     assert response == "Hello! How can I help you today?"
 
 
-async def test_chat_completion_no_choices() -> None:
-    """Test chat completion with no choices."""
-    mock_response = AsyncMock()
-    mock_response.status = 200
-    mock_response.json = AsyncMock(return_value={"choices": []})
-    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_response.__aexit__ = AsyncMock(return_value=None)
-
-    mock_session = MagicMock()
-    mock_session.post = MagicMock(return_value=mock_response)
-    mock_session.closed = False
+async def test_chat_completion_invalid_json(
+    api_client: OpenLLMApiClient, mock_session_factory: MockSessionFactory
+) -> None:
+    """Test chat completion with a body that is not JSON."""
+    mock_session_factory(method="post", body=b"<html>Bad Gateway</html>")
 
-    client = OpenLLMApiClient("http://localhost:4000/v1")
-    client._session = mock_session
-    client._owns_session = False
-
-    with pytest.raises(OpenLLMApiError, match="No response choices"):
-        await client.chat_completion(
+    with pytest.raises(OpenLLMApiError, match="Invalid JSON"):
+        await api_client.chat_completion(
             model="gpt-4o",
             messages=[{"role": "user", "content": "Hello"}],
         )
 
 
-async def test_chat_completion_auth_error() -> None:
-    """Test auth error on chat completion."""
-    mock_response = AsyncMock()
-    mock_response.status = 401
-    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_response.__aexit__ = AsyncMock(return_value=None)
-
-    mock_session = MagicMock()
-    mock_session.post = MagicMock(return_value=mock_response)
-    mock_session.closed = False
+async def test_chat_completion_stream(
+    api_client: OpenLLMApiClient,
+    mock_session: FakeSession,
+    mock_session_factory: MockSessionFactory,
+) -> None:
+    """Test streaming chat completion yields content deltas."""
+    mock_session_factory(
+        method="post",
+        lines=[
+            b'data: {"choices":[{"delta":{"role":"assistant"}}]}\n',
+            b"\n",
+            b'data: {"choices":[{"delta":{"content":"Hello"}}]}\n',
+            b"\n",
+            b": keep-alive\n",
+            b'data: {"choices":[{"delta":{"content":" there"}}]}\n',
+            b"\n",
+            b"data: [DONE]\n",
+        ],
+    )
 
-    client = OpenLLMApiClient("http://localhost:4000/v1")
-    client._session = mock_session
-    client._owns_session = False
+    fragments = [
+        fragment
+        async for fragment in api_client.chat_completion_stream(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "Hello"}],
+        )
+    ]
+
+    assert fragments == ["Hello", " there"]
+    _, _, kwargs = mock_session.calls[-1]
+    payload = orjson.loads(kwargs["data"])
+    assert payload["stream"] is True
+
+    # Only inactivity is bounded, so long generations are not cut off
+    timeout = kwargs["timeout"]
+    assert timeout.total is None
+    assert timeout.sock_connect == DEFAULT_TIMEOUT
+    assert timeout.sock_read == DEFAULT_TIMEOUT
+
+
+async def test_chat_completion_stream_split_event(
+    api_client: OpenLLMApiClient, mock_session_factory: MockSessionFactory
+) -> None:
+    """Test streaming chat completion with JSON split over data lines."""
+    mock_session_factory(
+        method="post",
+        lines=[
+            b'data: {"choices":[{"delta":\n',
+            b'data: {"content":"Hel"}}]}\n',
+            b"\n",
+            b'data: {"choices":[{"delta":{"content":"lo"}}]}\n',
+            b"\n",
+            b"data: [DONE]\n",
+        ],
+    )
 
-    with pytest.raises(OpenLLMAuthError):
-        await client.chat_completion(
+    fragments = [
+        fragment
+        async for fragment in api_client.chat_completion_stream(
             model="gpt-4o",
             messages=[{"role": "user", "content": "Hello"}],
         )
+    ]
 
+    assert fragments == ["Hel", "lo"]
 
-async def test_test_connection() -> None:
+
+async def test_test_connection(
+    api_client: OpenLLMApiClient,
+    mock_session_factory: MockSessionFactory,
+    mock_models_body: bytes,
+) -> None:
     """Test connection test."""
-    mock_response = AsyncMock()
-    mock_response.status = 200
-    mock_response.json = AsyncMock(return_value={"data": [{"id": "gpt-4o"}]})
-    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_response.__aexit__ = AsyncMock(return_value=None)
+    mock_session_factory(body=mock_models_body)
 
-    mock_session = MagicMock()
-    mock_session.get = MagicMock(return_value=mock_response)
-    mock_session.closed = False
+    result = await api_client.test_connection()
 
-    client = OpenLLMApiClient("http://localhost:4000/v1")
-    client._session = mock_session
-    client._owns_session = False
+    assert result is True
 
-    result = await client.test_connection()
 
-    assert result is True
+async def test_close(mock_session: FakeSession) -> None:
+    """Test close only closes a session the client created."""
+    # A session passed in is left open for its owner
+    client = OpenLLMApiClient("http://localhost:4000/v1", session=mock_session)
+    await client.close()
+    assert not mock_session.closed
+
+    # A client that never opened a session has nothing to close
+    client = OpenLLMApiClient("http://localhost:4000/v1")
+    await client.close()
+    assert client._session is None
+
+    # An owned session is closed and released
+    client._session = mock_session
+    await client.close()
+    assert mock_session.closed
+    assert client._session is None
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, patch
 
+import pytest
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.openllm_conversation.api import OpenLLMApiError
@@ -17,6 +17,9 @@ from custom_components.openllm_conversation.const import (
     DOMAIN,
 )
 
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
 
 async def test_form_user_step(hass: HomeAssistant) -> None:
     """Test we get the user form."""
@@ -28,25 +31,15 @@ async def test_form_user_step(hass: HomeAssistant) -> None:
     assert result["errors"] == {}
 
 
-async def test_form_invalid_url(hass: HomeAssistant) -> None:
-    """Test we handle invalid URL."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
-
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {
-            CONF_BASE_URL: "not-a-valid-url",
-        },
-    )
-
-    assert result["type"] == FlowResultType.FORM
-    assert result["errors"] == {CONF_BASE_URL: "invalid_url_format"}
-
-
-async def test_form_invalid_url_scheme(hass: HomeAssistant) -> None:
-    """Test we handle invalid URL scheme."""
+@pytest.mark.parametrize(
+    ("base_url", "error"),
+    [
+        ("not-a-valid-url", "invalid_url_format"),
+        ("ftp://localhost:4000", "invalid_url_scheme"),
+    ],
+)
+async def test_form_invalid_url(hass: HomeAssistant, base_url: str, error: str) -> None:
+    """Test we handle invalid URLs."""
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
@@ -54,12 +47,12 @@ async def test_form_invalid_url_scheme(hass: HomeAssistant) -> None:
     result = await hass.config_entries.flow.async_configure(
         result["flow_id"],
         {
-            CONF_BASE_URL: "ftp://localhost:4000",
+            CONF_BASE_URL: base_url,
         },
     )
 
     assert result["type"] == FlowResultType.FORM
-    assert result["errors"] == {CONF_BASE_URL: "invalid_url_scheme"}
+    assert result["errors"] == {CONF_BASE_URL: error}
 
 
 async def test_form_cannot_connect(hass: HomeAssistant) -> None:
@@ -71,9 +64,6 @@ async def test_form_cannot_connect(hass: HomeAssistant) -> None:
     with patch(
         "custom_components.openllm_conversation.config_flow.OpenLLMApiClient.list_models",
         side_effect=OpenLLMApiError("Connection refused"),
-    ), patch(
-        "custom_components.openllm_conversation.config_flow.OpenLLMApiClient.close",
-        new_callable=AsyncMock,
     ):
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -89,7 +79,7 @@ async def test_form_cannot_connect(hass: HomeAssistant) -> None:
 
 async def test_full_flow(
     hass: HomeAssistant,
-    mock_models_response: list[dict[str, Any]],
+    mock_models_response: tuple[dict[str, Any], ...],
 ) -> None:
     """Test complete config flow."""
     result = await hass.config_entries.flow.async_init(
@@ -100,10 +90,7 @@ async def test_full_flow(
     with patch(
         "custom_components.openllm_conversation.config_flow.OpenLLMApiClient.list_models",
         new_callable=AsyncMock,
-        return_value=mock_models_response,
-    ), patch(
-        "custom_components.openllm_conversation.config_flow.OpenLLMApiClient.close",
-        new_callable=AsyncMock,
+        return_value=list(mock_models_response),
     ):
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -127,17 +114,22 @@ async def test_full_flow(
     assert result["type"] == FlowResultType.FORM
     assert result["step_id"] == "configure"
 
-    # Step 3: Configure agent
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {
-            "prompt_template": "You are a helpful assistant.",
-            "max_tokens": 1024,
-            "temperature": 0.7,
-            "context_messages": 5,
-            "timeout": 30,
-        },
-    )
+    # Step 3: Configure agent (entry setup is patched out, so no request is
+    # made to the endpoint)
+    with patch(
+        "custom_components.openllm_conversation.async_setup_entry",
+        return_value=True,
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
+                "prompt_template": "You are a helpful assistant.",
+                "max_tokens": 1024,
+                "temperature": 0.7,
+                "context_messages": 5,
+                "timeout": 30,
+            },
+        )
 
     assert result["type"] == FlowResultType.CREATE_ENTRY
     assert result["title"] == "OpenLLM Conversation (gpt-4o)"
@@ -156,9 +148,6 @@ async def test_manual_model_entry(hass: HomeAssistant) -> None:
         "custom_components.openllm_conversation.config_flow.OpenLLMApiClient.list_models",
         new_callable=AsyncMock,
         return_value=[],
-    ), patch(
-        "custom_components.openllm_conversation.config_flow.OpenLLMApiClient.close",
-        new_callable=AsyncMock,
     ):
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
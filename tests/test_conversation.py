@@ -0,0 +1,195 @@
+"""Tests for the conversation agent."""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openllm_conversation.const import (
+    CONF_CONTEXT_MESSAGES,
+    CONF_PROMPT_TEMPLATE,
+    DOMAIN,
+)
+from custom_components.openllm_conversation.conversation import (
+    CONVERSATION_TIMEOUT_SEC,
+    MAX_CONVERSATIONS,
+    ConversationData,
+    OpenLLMConversationEntity,
+)
+
+
+def _make_entity(
+    mock_config_entry_data: dict[str, Any],
+    mock_config_entry_options: dict[str, Any],
+    **options: Any,
+) -> OpenLLMConversationEntity:
+    """Create a conversation entity whose client echoes a numbered reply."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=mock_config_entry_data,
+        options={**mock_config_entry_options, **options},
+    )
+    client = MagicMock()
+    client.chat_completion = AsyncMock(
+        side_effect=lambda **kwargs: f"reply {client.chat_completion.await_count}"
+    )
+    return OpenLLMConversationEntity(entry, client)
+
+
+def _user_input(text: str, conversation_id: str | None = None) -> Any:
+    """Create the part of a ConversationInput that async_process reads."""
+    return SimpleNamespace(text=text, conversation_id=conversation_id, language="en")
+
+
+def _sent_messages(entity: OpenLLMConversationEntity) -> list[dict[str, str]]:
+    """Return the messages of the last chat completion request."""
+    messages: list[dict[str, str]] = entity._client.chat_completion.call_args.kwargs[
+        "messages"
+    ]
+    return messages
+
+
+@pytest.mark.parametrize("context_messages", [0, 1, 2])
+async def test_history_window(
+    mock_config_entry_data: dict[str, Any],
+    mock_config_entry_options: dict[str, Any],
+    context_messages: int,
+) -> None:
+    """Test only the last context_messages turns are sent to the API."""
+    entity = _make_entity(
+        mock_config_entry_data,
+        mock_config_entry_options,
+        **{CONF_CONTEXT_MESSAGES: context_messages},
+    )
+
+    for turn in range(1, 5):
+        await entity.async_process(_user_input(f"message {turn}", "conv"))
+
+    # Three earlier turns exist; at most context_messages of them are sent
+    history = [
+        {"role": role, "content": content}
+        for turn in range(1, 4)
+        for role, content in (
+            ("user", f"message {turn}"),
+            ("assistant", f"reply {turn}"),
+        )
+    ]
+    window = history[len(history) - context_messages * 2 :] if context_messages else []
+    assert _sent_messages(entity) == [
+        entity._system_message,
+        *window,
+        {"role": "user", "content": "message 4"},
+    ]
+
+
+async def test_history_capped(
+    mock_config_entry_data: dict[str, Any],
+    mock_config_entry_options: dict[str, Any],
+) -> None:
+    """Test stored history is capped at (context_messages + 5) * 2 messages."""
+    entity = _make_entity(
+        mock_config_entry_data,
+        mock_config_entry_options,
+        **{CONF_CONTEXT_MESSAGES: 1},
+    )
+
+    for turn in range(1, 11):
+        await entity.async_process(_user_input(f"message {turn}", "conv"))
+
+    messages = entity._conversation_history["conv"].messages
+    assert messages.maxlen == 12
+    assert len(messages) == 12
+    # The oldest turns were dropped
+    assert messages[0] == ("user", "message 5")
+    assert messages[-1] == ("assistant", "reply 10")
+
+
+async def test_conversation_id(
+    mock_config_entry_data: dict[str, Any],
+    mock_config_entry_options: dict[str, Any],
+) -> None:
+    """Test new conversation IDs are generated and existing ones resumed."""
+    entity = _make_entity(mock_config_entry_data, mock_config_entry_options)
+
+    result = await entity.async_process(_user_input("Hello"))
+    conversation_id = result.conversation_id
+    assert conversation_id
+    assert result.response.speech["plain"]["speech"] == "reply 1"
+
+    # The generated ID resumes the conversation
+    result = await entity.async_process(_user_input("Again", conversation_id))
+    assert result.conversation_id == conversation_id
+    assert _sent_messages(entity)[1:] == [
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "reply 1"},
+        {"role": "user", "content": "Again"},
+    ]
+
+    # An unknown ID starts a new conversation under that ID
+    result = await entity.async_process(_user_input("Hi", "other"))
+    assert result.conversation_id == "other"
+    assert _sent_messages(entity)[1:] == [{"role": "user", "content": "Hi"}]
+    assert entity._conversation_history.keys() == {conversation_id, "other"}
+
+
+async def test_expired_conversation_restarts(
+    mock_config_entry_data: dict[str, Any],
+    mock_config_entry_options: dict[str, Any],
+) -> None:
+    """Test a timed-out conversation is not resumed with its old history."""
+    entity = _make_entity(mock_config_entry_data, mock_config_entry_options)
+
+    await entity.async_process(_user_input("Hello", "conv"))
+    entity._conversation_history["conv"].last_used -= CONVERSATION_TIMEOUT_SEC + 1
+
+    await entity.async_process(_user_input("Again", "conv"))
+
+    assert _sent_messages(entity)[1:] == [{"role": "user", "content": "Again"}]
+    assert len(entity._conversation_history["conv"].messages) == 2
+
+
+async def test_system_message_not_mutated(
+    mock_config_entry_data: dict[str, Any],
+    mock_config_entry_options: dict[str, Any],
+) -> None:
+    """Test the shared system message is sent as-is on every turn."""
+    entity = _make_entity(mock_config_entry_data, mock_config_entry_options)
+    system_message = entity._system_message
+    expected = {
+        "role": "system",
+        "content": mock_config_entry_options[CONF_PROMPT_TEMPLATE],
+    }
+
+    for turn in range(3):
+        await entity.async_process(_user_input(f"message {turn}", "conv"))
+        assert _sent_messages(entity)[0] is system_message
+
+    assert system_message == expected
+
+
+async def test_conversations_trimmed(
+    mock_config_entry_data: dict[str, Any],
+    mock_config_entry_options: dict[str, Any],
+) -> None:
+    """Test the least recently used conversations are dropped past the limit."""
+    entity = _make_entity(mock_config_entry_data, mock_config_entry_options)
+
+    # One more conversation than allowed, used in order c0, c1, ...
+    now = time.monotonic()
+    for index in range(MAX_CONVERSATIONS + 1):
+        conv_data = ConversationData(4)
+        conv_data.last_used = now - MAX_CONVERSATIONS + index
+        entity._conversation_history[f"c{index}"] = conv_data
+
+    await entity.async_process(_user_input("Hello", "new"))
+
+    history = entity._conversation_history
+    assert "c0" not in history
+    assert "c1" in history
+    assert "new" in history
+    assert len(history) == MAX_CONVERSATIONS + 1
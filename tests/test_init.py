@@ -0,0 +1,62 @@
+"""Tests for the integration setup."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openllm_conversation import OpenLLMData, _async_warm_up
+from custom_components.openllm_conversation.api import (
+    OpenLLMApiClient,
+    OpenLLMConnectionError,
+)
+from custom_components.openllm_conversation.const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_setup_schedules_warm_up(
+    hass: HomeAssistant, mock_config_entry_data: dict[str, Any]
+) -> None:
+    """Test setting up an entry warms up the connection in the background."""
+    entry = MockConfigEntry(domain=DOMAIN, data=mock_config_entry_data)
+    entry.add_to_hass(hass)
+
+    with (
+        patch(
+            "custom_components.openllm_conversation._async_warm_up",
+            new_callable=AsyncMock,
+        ) as mock_warm_up,
+        patch.object(
+            hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
+        ),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    data: OpenLLMData = hass.data[DOMAIN][entry.entry_id]
+    mock_warm_up.assert_called_once_with(data.client)
+
+
+async def test_warm_up_failure_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    """Test a failed warm-up is only logged."""
+    client = OpenLLMApiClient("http://localhost:4000/v1")
+
+    with (
+        caplog.at_level(logging.DEBUG),
+        patch.object(
+            client,
+            "list_models",
+            new_callable=AsyncMock,
+            side_effect=OpenLLMConnectionError("Connection refused"),
+        ) as mock_list_models,
+    ):
+        await _async_warm_up(client)
+
+    mock_list_models.assert_awaited_once()
+    assert "Connection warm-up failed: Connection refused" in caplog.text